@@ -15,17 +15,21 @@
 Dependencies:
     - curl_cffi (recommended): pip install curl_cffi
     - requests (fallback): pip install requests
+    - aiohttp (optional, for async/batch checks): pip install aiohttp
     - ffmpeg (for recording)
 """
 
+import os
+import codecs
 import re
 import sys
-import json
 import subprocess
-import argparse
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
@@ -40,6 +44,8 @@
 
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     if not USING_CURL_CFFI:
         print("ERROR: Either curl_cffi or requests library required.")
@@ -47,6 +53,15 @@
         print("         or: pip install requests")
         sys.exit(1)
 
+# Optional: orjson parses the API's JSON straight from bytes, skipping
+# requests' charset detection and text decoding
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+
 
 class PerformerStatus(Enum):
     """Possible performer statuses"""
@@ -75,6 +90,118 @@ def __init__(self, message: str, status: PerformerStatus):
         super().__init__(message)
 
 
+DEFAULT_IMPERSONATE = "chrome"
+
+# Process-wide HTTP session, reused across CAM4Standalone instances so that
+# pooled connections and TLS sessions survive short-lived objects
+_SHARED_SESSION = None
+
+# Long-lived workers for check_performer's background profile fetch. curl_cffi
+# keeps one Curl handle (and so one connection) per thread, so a fresh thread
+# per call would pay a new TCP+TLS handshake every time
+_SHARED_EXECUTOR = None
+
+
+def _new_session(impersonate: str = DEFAULT_IMPERSONATE):
+    """Create a configured curl_cffi or requests session"""
+    # Create session with browser impersonation if available
+    if USING_CURL_CFFI:
+        # curl_cffi pools and reuses connections internally
+        return curl_requests.Session(impersonate=impersonate, default_headers=True)
+    
+    session = requests.Session()
+    # Keep connections to cam4.com and the CDN alive across checks
+    adapter = HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Connection': 'keep-alive'
+    })
+    return session
+
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use"""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        _SHARED_SESSION = _new_session()
+    return _SHARED_SESSION
+
+
+def _get_executor():
+    """Return the shared worker pool, creating it on first use"""
+    global _SHARED_EXECUTOR
+    if _SHARED_EXECUTOR is None:
+        _SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cam4')
+    return _SHARED_EXECUTOR
+
+
+def close_shared_session():
+    """Close the shared HTTP session; the next instance creates a fresh one"""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is not None:
+        _SHARED_SESSION.close()
+        _SHARED_SESSION = None
+
+
+def _new_async_session(limit_per_host: int = 20):
+    """Create a pooled aiohttp session (bound to the event loop it is used on)"""
+    # aiohttp is optional and slow to import, so only load it for async checks
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("aiohttp is required for async checks. Install with: pip install aiohttp") from None
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=limit_per_host, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers={'User-Agent': USER_AGENT}
+    )
+
+
+def _read_head(response, size: int) -> bytes:
+    """Read at most size bytes from the start of a streamed response body"""
+    head = b''
+    for chunk in response.iter_content(chunk_size=size):
+        head += chunk
+        if len(head) >= size:
+            break
+    return head[:size]
+
+
+async def _aread_head(response, size: int) -> bytes:
+    """Read at most size bytes from the start of an aiohttp response body"""
+    head = b''
+    while len(head) < size:
+        chunk = await response.content.read(size - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+def _drain_pipe(pipe, callback):
+    """Pass everything written to pipe on to callback until EOF (run in a thread)"""
+    # Multi-byte characters may be split across reads
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    fd = pipe.fileno()
+    while True:
+        chunk = os.read(fd, 65536)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            try:
+                callback(text)
+            except Exception:
+                # Keep draining: if the pipe stops being read, ffmpeg blocks on it
+                pass
+        if not chunk:
+            break
+    pipe.close()
+
+
 class CAM4Standalone:
     """
     Standalone CAM4 stream checker and recorder.
@@ -84,24 +211,66 @@ class CAM4Standalone:
     impersonation when available (bypasses anti-bot protections).
     """
     
-    VALID_URL_PATTERN = r'https?://(?:[^/]+\.)?cam4\.com/(?P<id>[a-z0-9_]+)'
+    # Matched against the lowercased URL, so no re.IGNORECASE needed
+    _VALID_URL_RE = re.compile(r'https?://(?:[^/]+\.)?cam4\.com/(?P<id>[a-z0-9_]+)')
+    VALID_URL_PATTERN = _VALID_URL_RE.pattern
     BASE_API_URL = "https://www.cam4.com/rest/v1.0/profile"
     THUMBNAIL_BASE_URL = "https://snapshots.xcdnpro.com/thumbnails"
+    # Bytes of the playlist requested when verifying a stream
+    PLAYLIST_PROBE_SIZE = 512
+    # Most profiles kept in the cache; the oldest is dropped beyond this
+    PROFILE_CACHE_SIZE = 1024
+    # ffmpeg argv template: reconnect instead of exiting on transient CDN
+    # errors, and fetch HLS segments over persistent, pipelined HTTP
+    # connections. Probing is left at ffmpeg's defaults so stream-copied
+    # audio gets its codec parameters, and no -map is given so only the
+    # best variant of the master playlist is recorded.
+    # The None slots are filled with the stream URL and the output path
+    _FFMPEG_BASE = (
+        'ffmpeg',
+        '-loglevel', 'error',
+        '-nostdin',
+        '-fflags', '+nobuffer',
+        '-rw_timeout', '10000000',
+        '-reconnect', '1',
+        '-reconnect_streamed', '1',
+        '-reconnect_delay_max', '5',
+        '-http_persistent', '1',
+        '-http_multiple', '1',
+        '-multiple_requests', '1',
+        '-seg_max_retry', '5',
+        '-i', None,
+        '-c', 'copy',
+        '-y',
+        None
+    )
+    _FFMPEG_INPUT_INDEX = _FFMPEG_BASE.index('-i') + 1
+    _FFMPEG_LOGLEVEL_INDEX = _FFMPEG_BASE.index('-loglevel') + 1
     
-    def __init__(self, verbose: bool = False, impersonate: str = "chrome"):
+    def __init__(
+        self,
+        verbose: bool = False,
+        impersonate: str = DEFAULT_IMPERSONATE,
+        profile_ttl: float = 5.0
+    ):
         self.verbose = verbose
         self.impersonate = impersonate
         self._using_curl_cffi = USING_CURL_CFFI
         
-        # Create session with browser impersonation if available
+        # Profile info changes rarely compared to typical poll rates, so it is
+        # cached per username for profile_ttl seconds (stream info never is)
+        self.profile_ttl = profile_ttl
+        self._profile_cache: Dict[str, Tuple[float, dict]] = {}
+        
+        # Reuse the process-wide session unless a custom impersonation is requested
+        if impersonate == DEFAULT_IMPERSONATE:
+            self.session = _get_session()
+        else:
+            self.session = _new_session(impersonate)
+        
         if USING_CURL_CFFI:
-            self.session = curl_requests.Session(impersonate=impersonate)
             self._log(f"Using curl_cffi with {impersonate} impersonation")
         else:
-            self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
-            })
             self._log("Using requests (no impersonation - install curl_cffi for better compatibility)")
     
     def _log(self, message: str):
@@ -111,36 +280,70 @@ def _log(self, message: str):
     
     def extract_username(self, url: str) -> str:
         """Extract username from CAM4 URL"""
-        match = re.match(self.VALID_URL_PATTERN, url, re.IGNORECASE)
+        match = self._VALID_URL_RE.match(url.lower())
         if not match:
             raise CAM4Error(
                 f"Invalid CAM4 URL: {url}",
                 PerformerStatus.NOT_FOUND
             )
-        return match.group('id').lower()
+        return match.group('id')
     
-    def get_profile_info(self, username: str) -> dict:
+    def _cached_profile(self, username: str) -> Optional[dict]:
+        """Return the cached profile for username if it is younger than profile_ttl"""
+        cached_at, profile = self._profile_cache.get(username, (0.0, None))
+        if profile is None:
+            return None
+        if time.monotonic() - cached_at < self.profile_ttl:
+            return profile
+        # Expired entries are dropped so the cache doesn't outgrow the usernames in use
+        self._profile_cache.pop(username, None)
+        return None
+    
+    def _cache_profile(self, username: str, profile: Optional[dict]):
+        """Remember a successfully fetched profile"""
+        if profile:
+            # Re-insert so the dict stays ordered oldest first
+            self._profile_cache.pop(username, None)
+            self._profile_cache[username] = (time.monotonic(), profile)
+            if len(self._profile_cache) > self.PROFILE_CACHE_SIZE:
+                self._profile_cache.pop(next(iter(self._profile_cache)), None)
+    
+    def _fetch_json(self, url: str) -> Optional[dict]:
         """
-        Get performer profile information from API.
+        Fetch a JSON API endpoint.
         
         Returns:
-            dict with profile info or None if not found
+            Parsed JSON, or None for empty (204/404) or failed responses
         """
-        url = f"{self.BASE_API_URL}/{username}/info"
-        self._log(f"Fetching profile info for {username}")
-        
         try:
             response = self.session.get(url, timeout=10)
-            if response.status_code == 404:
+            # 204 No Content means not streaming, 404 means no such performer
+            if response.status_code in (204, 404):
                 return None
             response.raise_for_status()
-            return response.json()
-        except json.JSONDecodeError:
-            return None
+            return _json_loads(response.content) if response.content else None
         except Exception as e:
-            self._log(f"Error fetching profile: {e}")
+            self._log(f"Error fetching {url}: {e}")
             return None
     
+    def get_profile_info(self, username: str) -> dict:
+        """
+        Get performer profile information from API.
+        
+        Results are cached for profile_ttl seconds.
+        
+        Returns:
+            dict with profile info or None if not found
+        """
+        profile = self._cached_profile(username)
+        if profile is not None:
+            return profile
+        
+        self._log(f"Fetching profile info for {username}")
+        profile = self._fetch_json(f"{self.BASE_API_URL}/{username}/info")
+        self._cache_profile(username, profile)
+        return profile
+    
     def get_stream_info(self, username: str) -> Optional[dict]:
         """
         Get stream information from API.
@@ -148,24 +351,39 @@ def get_stream_info(self, username: str) -> Optional[dict]:
         Returns:
             dict with stream info including cdnURL, or None if not streaming
         """
-        url = f"{self.BASE_API_URL}/{username}/streamInfo"
         self._log(f"Fetching stream info for {username}")
+        return self._fetch_json(f"{self.BASE_API_URL}/{username}/streamInfo") or None
+    
+    def _classify_playlist(self, status_code: int, head: bytes) -> Tuple[bool, Optional[str]]:
+        """
+        Classify an m3u8 response as accessible or not from the start of its body.
         
-        try:
-            response = self.session.get(url, timeout=10)
-            # 204 No Content means not streaming
-            if response.status_code == 204:
-                return None
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            data = response.json()
-            return data if data else None
-        except json.JSONDecodeError:
-            return None
-        except Exception as e:
-            self._log(f"Error fetching stream info: {e}")
-            return None
+        Returns:
+            Tuple of (is_accessible, error_message)
+        """
+        # Fast path: a valid playlist starts with the m3u8 signature
+        # (206 Partial Content is the expected answer to the Range probe)
+        if status_code in (200, 206) and head.startswith(b'#EXTM3U'):
+            return True, None
+        
+        content = head.lower()
+        
+        # CDN returns this message for private/away streams
+        if b'not allowed to view' in content or b'session is not allowed' in content:
+            return False, "Stream not accessible - performer may be in a private show or away"
+        
+        if status_code in (400, 403):
+            return False, "Stream not accessible - performer may be in a private show or away"
+        
+        # Check if it's a valid m3u8 playlist
+        if status_code in (200, 206) and b'#extm3u' in content:
+            return True, None
+        
+        return False, "Invalid stream response"
+    
+    def _probe_headers(self) -> dict:
+        """Headers requesting only the start of the playlist"""
+        return {'Range': f'bytes=0-{self.PLAYLIST_PROBE_SIZE - 1}'}
     
     def verify_stream_accessible(self, m3u8_url: str) -> Tuple[bool, Optional[str]]:
         """
@@ -177,40 +395,24 @@ def verify_stream_accessible(self, m3u8_url: str) -> Tuple[bool, Optional[str]]:
         self._log(f"Verifying stream accessibility")
         
         try:
-            response = self.session.get(m3u8_url, timeout=10)
-            content = response.text.lower()
-            
-            # CDN returns this message for private/away streams
-            if 'not allowed to view' in content or 'session is not allowed' in content:
-                return False, "Stream not accessible - performer may be in a private show or away"
-            
-            if response.status_code in (400, 403):
-                return False, "Stream not accessible - performer may be in a private show or away"
-            
-            # Check if it's a valid m3u8 playlist
-            if '#EXTM3U' in response.text:
-                return True, None
-            
-            return False, "Invalid stream response"
-            
+            # Only the first bytes are needed to tell a playlist from an error page
+            response = self.session.get(m3u8_url, headers=self._probe_headers(), stream=True, timeout=10)
+            try:
+                head = _read_head(response, self.PLAYLIST_PROBE_SIZE)
+            finally:
+                response.close()
+            return self._classify_playlist(response.status_code, head)
         except Exception as e:
             return False, f"Error accessing stream: {e}"
     
-    def check_performer(self, url: str) -> PerformerInfo:
-        """
-        Check performer status and get stream URL if available.
-        
-        Args:
-            url: CAM4 performer URL
-            
-        Returns:
-            PerformerInfo with status and stream details
-        """
-        username = self.extract_username(url)
-        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
-        
+    @staticmethod
+    def _has_playlist(stream_info: Optional[dict]) -> bool:
+        """Whether the stream info carries a playlist URL, i.e. the performer is streaming"""
+        return bool(stream_info and stream_info.get('cdnURL'))
+    
+    def _profile_result(self, username: str, profile: Optional[dict]) -> Optional[PerformerInfo]:
+        """Return a PerformerInfo if the profile rules out streaming, else None"""
         # Check if performer exists
-        profile = self.get_profile_info(username)
         if not profile:
             return PerformerInfo(
                 username=username,
@@ -224,12 +426,16 @@ def check_performer(self, url: str) -> PerformerInfo:
             return PerformerInfo(
                 username=username,
                 status=PerformerStatus.OFFLINE,
-                thumbnail_url=thumbnail_url,
+                thumbnail_url=f"{self.THUMBNAIL_BASE_URL}/{username}",
                 error_message=f"{username}: Performer is currently offline"
             )
         
-        # Get stream info
-        stream_info = self.get_stream_info(username)
+        return None
+    
+    def _stream_result(self, username: str, stream_info: Optional[dict]) -> Optional[PerformerInfo]:
+        """Return a PerformerInfo if the stream info has no playlist, else None"""
+        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
+        
         if not stream_info:
             return PerformerInfo(
                 username=username,
@@ -239,8 +445,7 @@ def check_performer(self, url: str) -> PerformerInfo:
             )
         
         # Get CDN URL
-        cdn_url = stream_info.get('cdnURL')
-        if not cdn_url:
+        if not stream_info.get('cdnURL'):
             return PerformerInfo(
                 username=username,
                 status=PerformerStatus.ONLINE_NOT_STREAMING,
@@ -248,8 +453,18 @@ def check_performer(self, url: str) -> PerformerInfo:
                 error_message=f"{username}: Stream info found but no playlist URL available"
             )
         
-        # Verify stream is accessible (not private/away)
-        is_accessible, error = self.verify_stream_accessible(cdn_url)
+        return None
+    
+    def _access_result(
+        self,
+        username: str,
+        cdn_url: str,
+        is_accessible: bool,
+        error: Optional[str]
+    ) -> PerformerInfo:
+        """Build the final PerformerInfo once the playlist has been verified"""
+        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
+        
         if not is_accessible:
             return PerformerInfo(
                 username=username,
@@ -266,11 +481,218 @@ def check_performer(self, url: str) -> PerformerInfo:
             thumbnail_url=thumbnail_url
         )
     
+    def check_performer(self, url: str) -> PerformerInfo:
+        """
+        Check performer status and get stream URL if available.
+        
+        Args:
+            url: CAM4 performer URL
+            
+        Returns:
+            PerformerInfo with status and stream details
+        """
+        username = self.extract_username(url)
+        
+        # Profile and stream info are independent, so fetch the profile on a
+        # persistent worker thread while this thread fetches the stream info
+        f_profile = _get_executor().submit(self.get_profile_info, username)
+        stream_info = self.get_stream_info(username)
+        
+        # A playlist URL proves the performer is streaming; the profile is
+        # only needed to explain why there is no stream
+        if not self._has_playlist(stream_info):
+            profile = f_profile.result()
+            return self._profile_result(username, profile) or self._stream_result(username, stream_info)
+        
+        # Verify stream is accessible (not private/away)
+        cdn_url = stream_info['cdnURL']
+        is_accessible, error = self.verify_stream_accessible(cdn_url)
+        return self._access_result(username, cdn_url, is_accessible, error)
+    
+    def check_streaming_only(self, url: str) -> PerformerInfo:
+        """
+        Quick "is live?" check using a single streamInfo request.
+        
+        The result is coarse: STREAMING with stream_url set (the playlist is
+        not verified for private/away shows), or OFFLINE for every other case.
+        Use check_performer to tell the other statuses apart.
+        
+        Args:
+            url: CAM4 performer URL
+            
+        Returns:
+            PerformerInfo with STREAMING or OFFLINE status
+        """
+        username = self.extract_username(url)
+        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
+        
+        stream_info = self.get_stream_info(username)
+        if not self._has_playlist(stream_info):
+            return PerformerInfo(
+                username=username,
+                status=PerformerStatus.OFFLINE,
+                thumbnail_url=thumbnail_url,
+                error_message=f"{username}: Performer is not currently streaming"
+            )
+        
+        return PerformerInfo(
+            username=username,
+            status=PerformerStatus.STREAMING,
+            stream_url=stream_info['cdnURL'],
+            thumbnail_url=thumbnail_url
+        )
+    
+    async def _aget_json(self, session, url: str, empty_statuses: tuple) -> Optional[dict]:
+        """Fetch a JSON API endpoint with aiohttp, returning None on empty or failed responses"""
+        import asyncio
+        import aiohttp  # loaded by _new_async_session
+        try:
+            async with session.get(url) as response:
+                if response.status in empty_statuses:
+                    return None
+                response.raise_for_status()
+                return _json_loads(await response.read()) or None
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self._log(f"Error fetching {url}: {e}")
+            return None
+    
+    async def _aget_profile_info(self, session, username: str) -> Optional[dict]:
+        """Async version of get_profile_info, sharing its cache"""
+        profile = self._cached_profile(username)
+        if profile is None:
+            profile = await self._aget_json(session, f"{self.BASE_API_URL}/{username}/info", (404,))
+            self._cache_profile(username, profile)
+        return profile
+    
+    async def averify_stream_accessible(self, session, m3u8_url: str) -> Tuple[bool, Optional[str]]:
+        """Async version of verify_stream_accessible"""
+        self._log(f"Verifying stream accessibility")
+        
+        import asyncio
+        import aiohttp  # loaded by _new_async_session
+        try:
+            async with session.get(m3u8_url, headers=self._probe_headers()) as response:
+                head = await _aread_head(response, self.PLAYLIST_PROBE_SIZE)
+                return self._classify_playlist(response.status, head)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return False, f"Error accessing stream: {e}"
+    
+    async def acheck_performer(self, url: str, session=None) -> PerformerInfo:
+        """
+        Async version of check_performer.
+        
+        Profile and stream info are fetched concurrently; the profile is only
+        awaited when there is no playlist to verify.
+        
+        Args:
+            url: CAM4 performer URL
+            session: aiohttp.ClientSession to use (default: a session opened
+                and closed for this call)
+            
+        Returns:
+            PerformerInfo with status and stream details
+        """
+        import asyncio
+        
+        if session is None:
+            async with _new_async_session() as session:
+                return await self.acheck_performer(url, session)
+        
+        username = self.extract_username(url)
+        
+        profile_task = asyncio.ensure_future(self._aget_profile_info(session, username))
+        stream_info = await self._aget_json(session, f"{self.BASE_API_URL}/{username}/streamInfo", (204, 404))
+        
+        # Same precedence as check_performer: a playlist URL means streaming
+        if not self._has_playlist(stream_info):
+            profile = await profile_task
+            return self._profile_result(username, profile) or self._stream_result(username, stream_info)
+        profile_task.cancel()
+        
+        cdn_url = stream_info['cdnURL']
+        is_accessible, error = await self.averify_stream_accessible(session, cdn_url)
+        return self._access_result(username, cdn_url, is_accessible, error)
+    
+    async def acheck_performer_batch(self, urls: list) -> list:
+        """
+        Check several performers concurrently on one event loop.
+        
+        Returns:
+            List in the same order as urls, holding a PerformerInfo for each
+            check, or the exception it raised (e.g. CAM4Error for an invalid URL)
+        """
+        import asyncio
+        
+        async with _new_async_session() as session:
+            return await asyncio.gather(
+                *(self.acheck_performer(url, session) for url in urls),
+                return_exceptions=True
+            )
+    
+    async def check_many(self, urls: list, concurrency: int = 16):
+        """
+        Check many performers with at most concurrency checks in flight.
+        
+        Uses its own aiohttp session sized to the concurrency limit and yields
+        results as they complete, so callers can report progress instead of
+        waiting on the slowest check.
+        
+        Args:
+            urls: CAM4 performer URLs
+            concurrency: Maximum number of simultaneous checks
+            
+        Yields:
+            (url, PerformerInfo) tuples in completion order; a check that raised
+            yields (url, exception) instead
+            
+        Raises:
+            ValueError: If concurrency is less than 1
+        """
+        # A zero-sized semaphore would never let a check start
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        
+        import asyncio
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def check(url):
+            async with semaphore:
+                try:
+                    return url, await self.acheck_performer(url, session)
+                except Exception as e:
+                    return url, e
+        
+        async with _new_async_session(limit_per_host=concurrency) as session:
+            tasks = [asyncio.ensure_future(check(url)) for url in urls]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    yield await future
+            finally:
+                # Don't leave checks running if the caller stops iterating early,
+                # and let them finish cancelling before the session is closed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def check_performers(self, urls: list) -> list:
+        """
+        Synchronous wrapper around acheck_performer_batch.
+        
+        Returns:
+            List of PerformerInfo (or exceptions), in the same order as urls
+        """
+        # asyncio is slow to import, so only the async entry points load it
+        import asyncio
+        
+        return asyncio.run(self.acheck_performer_batch(urls))
+    
     def record_stream(
         self,
         url: str,
         output_path: Optional[str] = None,
-        ffmpeg_args: Optional[list] = None
+        ffmpeg_args: Optional[list] = None,
+        log_file: Optional[str] = None,
+        log_callback: Optional[Callable[[str], None]] = None
     ) -> subprocess.Popen:
         """
         Start recording a CAM4 stream using ffmpeg.
@@ -279,6 +701,9 @@ def record_stream(
             url: CAM4 performer URL
             output_path: Output file path (default: {username}_{timestamp}.ts)
             ffmpeg_args: Additional ffmpeg arguments
+            log_file: File to append ffmpeg's log output to (default: discarded)
+            log_callback: Called from a background thread with chunks of ffmpeg's
+                log output (takes precedence over log_file)
             
         Returns:
             subprocess.Popen object for the ffmpeg process
@@ -296,29 +721,47 @@ def record_stream(
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = f"{info.username}_{timestamp}.ts"
         
-        # Build ffmpeg command
-        cmd = [
-            'ffmpeg',
-            '-i', info.stream_url,
-            '-c:v', 'copy',
-            '-c:a', 'copy',
-            '-y'
-        ]
+        # Build ffmpeg command from the template; extra arguments go right
+        # before the output path
+        cmd = list(self._FFMPEG_BASE)
+        cmd[self._FFMPEG_INPUT_INDEX] = info.stream_url
+        cmd[-1] = output_path
+        
+        # Other extensions let ffmpeg pick the container from the file name
+        if output_path.lower().endswith('.ts'):
+            cmd[-1:-1] = ['-f', 'mpegts']
         
         if ffmpeg_args:
-            cmd.extend(ffmpeg_args)
+            cmd[-1:-1] = ffmpeg_args
         
-        cmd.append(output_path)
+        # Only errors are worth producing when the output is discarded; a
+        # requested log gets ffmpeg's normal output
+        if log_callback or log_file:
+            cmd[self._FFMPEG_LOGLEVEL_INDEX] = 'info'
         
         self._log(f"Starting recording: {output_path}")
         self._log(f"Stream URL: {info.stream_url}")
         
-        # Start ffmpeg process
-        process = subprocess.Popen(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
-        )
+        # Start ffmpeg process. Its output must never go to an unread pipe:
+        # once the pipe buffer fills up ffmpeg blocks and stalls
+        if log_callback:
+            stderr = subprocess.PIPE
+        elif log_file:
+            stderr = open(log_file, 'ab')
+        else:
+            stderr = subprocess.DEVNULL
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.DEVNULL,
+                stderr=stderr
+            )
+        finally:
+            if stderr not in (subprocess.PIPE, subprocess.DEVNULL):
+                stderr.close()
+        
+        if log_callback:
+            threading.Thread(target=_drain_pipe, args=(process.stderr, log_callback), daemon=True).start()
         
         return process
     
@@ -340,11 +783,16 @@ def download_thumbnail(self, url: str, output_path: Optional[str] = None) -> Opt
             output_path = f"{username}_thumb.jpg"
         
         try:
-            response = self.session.get(thumbnail_url, timeout=10)
-            response.raise_for_status()
-            
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            response = self.session.get(thumbnail_url, stream=True, timeout=10)
+            try:
+                response.raise_for_status()
+                
+                # Write in 64 KB chunks rather than holding the whole image in memory
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=65536):
+                        f.write(chunk)
+            finally:
+                response.close()
             
             self._log(f"Thumbnail saved to {output_path}")
             return output_path
@@ -354,8 +802,91 @@ def download_thumbnail(self, url: str, output_path: Optional[str] = None) -> Opt
             return None
 
 
+def _status_dict(info) -> dict:
+    """Build the JSON record for a PerformerInfo, or for the exception a check raised"""
+    if isinstance(info, Exception):
+        return {
+            'username': None,
+            'status': info.status.value if isinstance(info, CAM4Error) else None,
+            'stream_url': None,
+            'thumbnail_url': None,
+            'error': str(info)
+        }
+    return {
+        'username': info.username,
+        'status': info.status.value,
+        'stream_url': info.stream_url,
+        'thumbnail_url': info.thumbnail_url,
+        'error': info.error_message
+    }
+
+
+def _print_status(info: PerformerInfo, as_json: bool):
+    """Print a performer's status for the CLI"""
+    import json
+    
+    if as_json:
+        print(json.dumps(_status_dict(info), indent=2))
+    else:
+        if info.status == PerformerStatus.STREAMING:
+            print(f"✓ {info.username} is STREAMING")
+            print(f"  Stream URL: {info.stream_url}")
+        else:
+            print(f"✗ {info.error_message}")
+
+
+def _check_many_cli(cam4: CAM4Standalone, urls: list, concurrency: int, as_json: bool) -> bool:
+    """
+    Check several performers, printing each status as soon as it is known.
+    
+    JSON output is one compact object per line (JSON Lines), each with the
+    same keys as single-URL output plus the URL that was checked. Without
+    aiohttp the URLs are checked one after another.
+    
+    Returns:
+        True if every performer is streaming
+    """
+    import json
+    import asyncio
+    import importlib.util
+    
+    all_streaming = True
+    
+    def report(url, info):
+        nonlocal all_streaming
+        if isinstance(info, Exception) or info.status != PerformerStatus.STREAMING:
+            all_streaming = False
+        
+        if as_json:
+            print(json.dumps({'url': url, **_status_dict(info)}), flush=True)
+        elif isinstance(info, Exception):
+            print(f"✗ {url}: {info}")
+        else:
+            _print_status(info, as_json)
+    
+    if importlib.util.find_spec('aiohttp') is None:
+        cam4._log("aiohttp not installed, checking performers sequentially")
+        for url in urls:
+            try:
+                info = cam4.check_performer(url)
+            except Exception as e:
+                info = e
+            report(url, info)
+    else:
+        async def run():
+            async for url, info in cam4.check_many(urls, concurrency):
+                report(url, info)
+        
+        asyncio.run(run())
+    
+    return all_streaming
+
+
 def main():
     """Main CLI entry point"""
+    # CLI-only imports are kept out of module scope so library users don't pay for them
+    import argparse
+    
     parser = argparse.ArgumentParser(
         description='CAM4 Standalone Stream Recorder',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -364,6 +895,9 @@ def main():
     Check performer status:
         python cam4_standalone.py --check https://www.cam4.com/performer
     
+    Check several performers concurrently:
+        python cam4_standalone.py --check https://www.cam4.com/one https://www.cam4.com/two
+    
     Record stream:
         python cam4_standalone.py https://www.cam4.com/performer
         python cam4_standalone.py https://www.cam4.com/performer -o output.ts
@@ -373,43 +907,41 @@ def main():
         """
     )
     
-    parser.add_argument('url', help='CAM4 performer URL')
+    parser.add_argument('url', nargs='+', help='CAM4 performer URL (several allowed with --check/--json)')
     parser.add_argument('-o', '--output', help='Output file path')
     parser.add_argument('-v', '--verbose', action='store_true', help='Verbose output')
     parser.add_argument('--check', action='store_true', help='Only check status, do not record')
     parser.add_argument('--thumbnail', action='store_true', help='Download thumbnail only')
-    parser.add_argument('--json', action='store_true', help='Output status as JSON')
+    parser.add_argument('--json', action='store_true',
+                        help='Output status as JSON (one object per line for several URLs)')
+    parser.add_argument('--concurrency', type=int, default=16,
+                        help='Maximum simultaneous checks when checking several URLs (default: 16)')
     
     args = parser.parse_args()
     
+    if len(args.url) > 1 and not (args.check or args.json):
+        parser.error('multiple URLs are only supported with --check or --json')
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    url = args.url[0]
+    
     cam4 = CAM4Standalone(verbose=args.verbose)
     
     try:
         if args.check or args.json:
             # Check mode - just show status
-            info = cam4.check_performer(args.url)
-            
-            if args.json:
-                result = {
-                    'username': info.username,
-                    'status': info.status.value,
-                    'stream_url': info.stream_url,
-                    'thumbnail_url': info.thumbnail_url,
-                    'error': info.error_message
-                }
-                print(json.dumps(result, indent=2))
+            if len(args.url) > 1:
+                all_streaming = _check_many_cli(cam4, args.url, args.concurrency, args.json)
             else:
-                if info.status == PerformerStatus.STREAMING:
-                    print(f"✓ {info.username} is STREAMING")
-                    print(f"  Stream URL: {info.stream_url}")
-                else:
-                    print(f"✗ {info.error_message}")
+                info = cam4.check_performer(url)
+                _print_status(info, args.json)
+                all_streaming = info.status == PerformerStatus.STREAMING
             
-            sys.exit(0 if info.status == PerformerStatus.STREAMING else 1)
+            sys.exit(0 if all_streaming else 1)
         
         elif args.thumbnail:
             # Thumbnail mode
-            path = cam4.download_thumbnail(args.url, args.output)
+            path = cam4.download_thumbnail(url, args.output)
             if path:
                 print(f"Thumbnail saved to {path}")
                 sys.exit(0)
@@ -420,7 +952,7 @@ def main():
         else:
             # Record mode
             print(f"Starting recording...")
-            process = cam4.record_stream(args.url, args.output)
+            process = cam4.record_stream(url, args.output)
             print(f"Recording started. Press Ctrl+C to stop.")
             
             try:
@@ -2,7 +2,7 @@
 CAM4 Standalone Stream Checker and Recorder
 
 A lightweight module to check CAM4 performer status and record streams.
-No yt-dlp dependency required - uses curl_cffi (preferred), FlareSolverr, or requests.
+No yt-dlp dependency required - uses curl_cffi (preferred), FlareSolverr, httpx or requests.
 
 Usage:
     from cam4_standalone import CAM4Standalone, PerformerStatus
@@ -17,14 +17,24 @@
     - curl_cffi (recommended): pip install curl_cffi
     - FlareSolverr (optional): Docker container or standalone service
     - requests (fallback): pip install requests
+    - httpx (optional, HTTP/2 without curl_cffi): pip install "httpx[http2]"
+    - aiohttp (optional, for async/batch checks): pip install aiohttp
     - ffmpeg (for recording)
 """
 
+import os
+import codecs
 import re
+import sys
 import json
+import http.cookiejar
+import contextlib
 import subprocess
+import threading
+import time
 from datetime import datetime
-from typing import Optional, Tuple
+from typing import Callable, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from enum import Enum
 
@@ -36,8 +46,16 @@
 except ImportError:
     curl_requests = None
 
+# Guarded on its own so a curl_cffi without it still impersonates; only HTTP/2 pinning is lost
+try:
+    from curl_cffi.const import CurlHttpVersion
+except ImportError:
+    CurlHttpVersion = None
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError:
     requests = None
     if not USING_CURL_CFFI:
@@ -46,6 +64,15 @@
             "Install with: pip install curl_cffi (recommended) or pip install requests"
         )
 
+# Optional: orjson parses the API's JSON straight from bytes, skipping
+# requests' charset detection and text decoding
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+
 
 class PerformerStatus(Enum):
     """Possible performer statuses"""
@@ -74,6 +101,140 @@ def __init__(self, message: str, status: PerformerStatus):
         super().__init__(message)
 
 
+DEFAULT_IMPERSONATE = "chrome"
+
+# Process-wide HTTP session, reused across CAM4Standalone instances so that
+# pooled connections and TLS sessions survive short-lived objects
+_SHARED_SESSION = None
+
+# Long-lived workers for check_performer's background profile fetch. curl_cffi
+# keeps one Curl handle (and so one connection) per thread, so a fresh thread
+# per call would pay a new TCP+TLS handshake every time
+_SHARED_EXECUTOR = None
+
+
+def _new_session(impersonate: str = DEFAULT_IMPERSONATE, use_curl_cffi: bool = USING_CURL_CFFI, http2: bool = False):
+    """
+    Create a configured curl_cffi, httpx or requests session.
+    
+    With http2, curl_cffi is pinned to HTTP/2 and, without curl_cffi, httpx is
+    used instead of requests (which only speaks HTTP/1.1) if it and h2 are installed.
+    """
+    if use_curl_cffi:
+        # curl_cffi pools and reuses connections internally
+        if http2 and CurlHttpVersion is not None:
+            return curl_requests.Session(
+                impersonate=impersonate, default_headers=True, http_version=CurlHttpVersion.V2_0)
+        return curl_requests.Session(impersonate=impersonate, default_headers=True)
+    
+    if http2:
+        # httpx is optional; only import it when HTTP/2 is asked for. Its
+        # http2=True needs the h2 package, which plain "pip install httpx" lacks
+        try:
+            import httpx
+            import h2  # noqa: F401
+        except ImportError:
+            pass
+        else:
+            # Follow redirects like requests does
+            return httpx.Client(
+                http2=True, follow_redirects=True, headers={'User-Agent': USER_AGENT},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=32))
+    
+    session = requests.Session()
+    # Keep connections to cam4.com and the CDN alive across checks
+    session.mount('https://', HTTPAdapter(
+        pool_connections=4, pool_maxsize=32,
+        max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=(502, 503, 504))))
+    session.headers.update({'User-Agent': USER_AGENT, 'Connection': 'keep-alive'})
+    return session
+
+
+def _get_session():
+    """Return the shared HTTP session, creating it on first use."""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is None:
+        _SHARED_SESSION = _new_session()
+    return _SHARED_SESSION
+
+
+def _get_executor():
+    """Return the shared worker pool, creating it on first use."""
+    global _SHARED_EXECUTOR
+    if _SHARED_EXECUTOR is None:
+        _SHARED_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix='cam4')
+    return _SHARED_EXECUTOR
+
+
+def close_shared_session():
+    """Close the shared HTTP session; the next instance creates a fresh one."""
+    global _SHARED_SESSION
+    if _SHARED_SESSION is not None:
+        _SHARED_SESSION.close()
+        _SHARED_SESSION = None
+
+
+def _new_async_session(limit_per_host: int = 20):
+    """Create a pooled aiohttp session (bound to the event loop it is used on)"""
+    # aiohttp is optional and slow to import, so only load it for async checks
+    try:
+        import aiohttp
+    except ImportError:
+        raise ImportError("aiohttp is required for async checks. Install with: pip install aiohttp") from None
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=100, limit_per_host=limit_per_host, ttl_dns_cache=300),
+        timeout=aiohttp.ClientTimeout(total=10),
+        headers={'User-Agent': USER_AGENT}
+    )
+
+
+def _iter_body(response, chunk_size: int):
+    """Iterate over a response body in chunks (requests, curl_cffi or httpx)."""
+    if hasattr(response, 'iter_content'):
+        return response.iter_content(chunk_size=chunk_size)
+    return response.iter_bytes(chunk_size)
+
+
+def _read_head(response, size: int) -> bytes:
+    """Read at most size bytes from the start of a streamed response body."""
+    head = b''
+    for chunk in _iter_body(response, size):
+        head += chunk
+        if len(head) >= size:
+            break
+    return head[:size]
+
+
+async def _aread_head(response, size: int) -> bytes:
+    """Read at most size bytes from the start of an aiohttp response body."""
+    head = b''
+    while len(head) < size:
+        chunk = await response.content.read(size - len(head))
+        if not chunk:
+            break
+        head += chunk
+    return head
+
+
+def _drain_pipe(pipe, callback):
+    """Pass everything written to pipe on to callback until EOF (run in a thread)."""
+    # Multi-byte characters may be split across reads
+    decoder = codecs.getincrementaldecoder('utf-8')('replace')
+    fd = pipe.fileno()
+    while True:
+        chunk = os.read(fd, 65536)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            try:
+                callback(text)
+            except Exception:
+                # Keep draining: if the pipe stops being read, ffmpeg blocks on it
+                pass
+        if not chunk:
+            break
+    pipe.close()
+
+
 class FlareSolverrClient:
     """
     Client for FlareSolverr - a proxy that uses a real browser
@@ -121,6 +282,13 @@ def __init__(self, status_code: int, text: str, url: str):
     def json(self) -> dict:
         return json.loads(self.text)
     
+    def iter_content(self, chunk_size: int = 1):
+        for i in range(0, len(self.content), chunk_size):
+            yield self.content[i:i + chunk_size]
+    
+    def close(self):
+        pass
+    
     def raise_for_status(self):
         if self.status_code >= 400:
             raise Exception(f"HTTP Error {self.status_code}")
@@ -133,27 +301,48 @@ class CAM4Standalone:
     Request priority:
     1. curl_cffi (browser impersonation)
     2. FlareSolverr (real browser proxy)
-    3. requests (plain HTTP)
+    3. requests (plain HTTP), or httpx when http2=True and httpx[http2] is installed
     
     Authentication:
     - Pass cookies_file for Netscape format cookie file (exported from browser)
     - Pass cookies dict for direct cookie values
+    
+    Profile info is cached per username for profile_ttl seconds; stream info is always fetched fresh.
     """
     
-    VALID_URL_PATTERN = r'https?://(?:[^/]+\.)?cam4\.com/(?P<id>[a-z0-9_]+)'
+    # Matched against the lowercased URL, so no re.IGNORECASE needed
+    _VALID_URL_RE = re.compile(r'https?://(?:[^/]+\.)?cam4\.com/(?P<id>[a-z0-9_]+)')
+    VALID_URL_PATTERN = _VALID_URL_RE.pattern
     BASE_API_URL = "https://www.cam4.com/rest/v1.0/profile"
     THUMBNAIL_BASE_URL = "https://snapshots.xcdnpro.com/thumbnails"
+    # Bytes of the playlist requested when verifying a stream
+    PLAYLIST_PROBE_SIZE = 512
+    # Most profiles kept in the cache; the oldest is dropped beyond this
+    PROFILE_CACHE_SIZE = 1024
+    # ffmpeg argv template (None slots: stream URL, output path). Reconnect on transient CDN
+    # errors; persistent, pipelined HTTP for HLS segments. Default probing keeps copied audio
+    # parameters intact, and no -map means only the best master playlist variant is recorded
+    _FFMPEG_BASE = ('ffmpeg', '-loglevel', 'error', '-nostdin', '-fflags', '+nobuffer',
+                    '-rw_timeout', '10000000', '-reconnect', '1', '-reconnect_streamed', '1', '-reconnect_delay_max', '5',
+                    '-http_persistent', '1', '-http_multiple', '1', '-multiple_requests', '1', '-seg_max_retry', '5',
+                    '-i', None, '-c', 'copy', '-y', None)
+    _FFMPEG_INPUT_INDEX = _FFMPEG_BASE.index('-i') + 1
+    _FFMPEG_LOGLEVEL_INDEX = _FFMPEG_BASE.index('-loglevel') + 1
     
     def __init__(
         self, 
         verbose: bool = False, 
-        impersonate: str = "chrome",
+        impersonate: str = DEFAULT_IMPERSONATE,
         flaresolverr_url: Optional[str] = None,
         use_flaresolverr: bool = False,
         cookies_file: Optional[str] = None,
-        cookies: Optional[dict] = None
+        cookies: Optional[dict] = None,
+        profile_ttl: float = 5.0,
+        http2: bool = False
     ):
         self.verbose = verbose
+        self.profile_ttl = profile_ttl
+        self._profile_cache: Dict[str, Tuple[float, dict]] = {}
         self._flaresolverr = None
         self._use_flaresolverr = use_flaresolverr
         
@@ -163,13 +352,15 @@ def __init__(
                 self._log(f"FlareSolverr not responding at {flaresolverr_url}")
                 self._flaresolverr = None
         
-        if USING_CURL_CFFI and not use_flaresolverr:
-            self.session = curl_requests.Session(impersonate=impersonate)
+        # Cookies and non-default transports get a private session so they
+        # never leak into the process-wide one
+        if cookies_file or cookies or use_flaresolverr or http2 or impersonate != DEFAULT_IMPERSONATE:
+            self.session = _new_session(
+                impersonate, use_curl_cffi=USING_CURL_CFFI and not use_flaresolverr, http2=http2)
         else:
-            self.session = requests.Session()
-            self.session.headers.update({
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            })
+            self.session = _get_session()
+        if http2 and not (USING_CURL_CFFI and not use_flaresolverr) and not self._uses_httpx():
+            self._log('HTTP/2 needs curl_cffi or "httpx[http2]"; using requests (HTTP/1.1)')
         
         # Load cookies from file (Netscape format)
         if cookies_file:
@@ -184,117 +375,322 @@ def _load_cookies_from_file(self, filepath: str):
         """
         Load cookies from a Netscape format cookie file.
         This format is used by browser extensions like "Get cookies.txt" or "cookies.txt".
+        A file that can't be read raises OSError, since the caller explicitly asked for it.
         """
-        try:
-            with open(filepath, 'r') as f:
-                for line in f:
-                    line = line.strip()
-                    # Skip comments and empty lines
-                    if not line or line.startswith('#'):
-                        continue
-                    
-                    parts = line.split('\t')
-                    if len(parts) >= 7:
-                        domain, _, path, secure, expires, name, value = parts[:7]
-                        # Only load cam4.com cookies
-                        if 'cam4.com' in domain:
-                            self.session.cookies.set(
-                                name, value, 
-                                domain=domain,
-                                path=path,
-                                secure=(secure.upper() == 'TRUE')
-                            )
-            self._log(f"Loaded cookies from {filepath}")
-        except Exception as e:
-            self._log(f"Error loading cookies from {filepath}: {e}")
+        with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+            lines = f.read().splitlines()
+        
+        # Cookies go straight into the underlying CookieJar: unlike requests and curl_cffi,
+        # httpx's Cookies.set() takes no secure flag
+        session_jar = self._cookie_jar()
+        for line in lines:
+            # HttpOnly cookies are written with this prefix on the domain; they are not comments
+            http_only = line.startswith('#HttpOnly_')
+            if http_only:
+                line = line[len('#HttpOnly_'):]
+            # Skip comments, empty lines and malformed entries instead of rejecting the file
+            if not line.strip() or line.startswith('#'):
+                continue
+            
+            parts = line.split('\t')
+            if len(parts) >= 7:
+                domain, _, path, secure, expires, name, value = parts[:7]
+                # Only load cam4.com cookies
+                if 'cam4.com' in domain:
+                    session_jar.set_cookie(http.cookiejar.Cookie(
+                        0, name, value, None, False, domain, True, domain.startswith('.'), path, True,
+                        secure.upper() == 'TRUE', None, True, None, None,
+                        {'HttpOnly': None} if http_only else {}))
+        self._log(f"Loaded cookies from {filepath}")
     
     def _log(self, message: str):
         if self.verbose:
             print(f"[CAM4] {message}")
     
-    def _make_request(self, url: str, timeout: int = 10):
+    def _make_request(self, url: str, timeout: int = 10, stream: bool = False, headers: Optional[dict] = None):
         if self._use_flaresolverr and self._flaresolverr:
             try:
                 return self._flaresolverr.get(url, timeout=timeout)
             except Exception as e:
                 self._log(f"FlareSolverr failed: {e}")
-        return self.session.get(url, timeout=timeout)
+        return self._session_get(url, timeout=timeout, stream=stream, headers=headers)
+    
+    def _uses_httpx(self) -> bool:
+        """Whether the session is an httpx.Client (only created for http2 without curl_cffi)."""
+        httpx = sys.modules.get('httpx')  # only loaded if _new_session picked it
+        return httpx is not None and isinstance(self.session, httpx.Client)
+    
+    def _session_get(self, url: str, timeout: int = 10, stream: bool = False, headers: Optional[dict] = None):
+        if self._uses_httpx():
+            # httpx has no stream flag on get(); ranged/small bodies make it moot
+            return self.session.get(url, timeout=timeout, headers=headers)
+        return self.session.get(url, timeout=timeout, stream=stream, headers=headers)
     
     def extract_username(self, url: str) -> str:
         """Extract username from CAM4 URL"""
-        match = re.match(self.VALID_URL_PATTERN, url, re.IGNORECASE)
+        match = self._VALID_URL_RE.match(url.lower())
         if not match:
             raise CAM4Error(f"Invalid CAM4 URL: {url}", PerformerStatus.NOT_FOUND)
-        return match.group('id').lower()
+        return match.group('id')
     
-    def get_profile_info(self, username: str) -> Optional[dict]:
-        """Get performer profile information from API."""
-        try:
-            response = self._make_request(f"{self.BASE_API_URL}/{username}/info")
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
-            return response.json()
-        except:
+    def _cached_profile(self, username: str) -> Optional[dict]:
+        """Return the cached profile for username if it is younger than profile_ttl."""
+        cached_at, profile = self._profile_cache.get(username, (0.0, None))
+        if profile is None:
             return None
+        if time.monotonic() - cached_at < self.profile_ttl:
+            return profile
+        # Expired entries are dropped so the cache doesn't outgrow the usernames in use
+        self._profile_cache.pop(username, None)
+        return None
     
-    def get_stream_info(self, username: str) -> Optional[dict]:
-        """Get stream information from API."""
+    def _cache_profile(self, username: str, profile: Optional[dict]):
+        if profile:
+            # Re-insert so the dict stays ordered oldest first
+            self._profile_cache.pop(username, None)
+            self._profile_cache[username] = (time.monotonic(), profile)
+            if len(self._profile_cache) > self.PROFILE_CACHE_SIZE:
+                self._profile_cache.pop(next(iter(self._profile_cache)), None)
+    
+    def _fetch_json(self, url: str) -> Optional[dict]:
+        """Fetch a JSON API endpoint; None for empty (204/404) or failed responses."""
         try:
-            response = self._make_request(f"{self.BASE_API_URL}/{username}/streamInfo")
+            response = self._make_request(url)
             if response.status_code in (204, 404):
                 return None
             response.raise_for_status()
-            return response.json() or None
-        except:
+            return _json_loads(response.content) if response.content else None
+        except Exception as e:
+            self._log(f"Error fetching {url}: {e}")
             return None
     
+    def get_profile_info(self, username: str) -> Optional[dict]:
+        """Get performer profile information from API (cached for profile_ttl seconds)."""
+        profile = self._cached_profile(username)
+        if profile is not None:
+            return profile
+        profile = self._fetch_json(f"{self.BASE_API_URL}/{username}/info")
+        self._cache_profile(username, profile)
+        return profile
+    
+    def get_stream_info(self, username: str) -> Optional[dict]:
+        """Get stream information from API."""
+        return self._fetch_json(f"{self.BASE_API_URL}/{username}/streamInfo") or None
+    
+    def _classify_playlist(self, status_code: int, head: bytes) -> Tuple[bool, Optional[str]]:
+        """Classify an m3u8 response as (is_accessible, error_message) from the start of its body."""
+        # 206 Partial Content is the expected answer to the Range probe
+        if status_code in (200, 206) and head.startswith(b'#EXTM3U'):
+            return True, None
+        content = head.lower()
+        if b'not allowed to view' in content or b'session is not allowed' in content:
+            return False, "Stream not accessible - performer may be in a private show or away"
+        if status_code in (400, 403):
+            return False, "Stream not accessible - performer may be in a private show or away"
+        if status_code in (200, 206) and b'#extm3u' in content:
+            return True, None
+        return False, "Invalid stream response"
+    
+    def _probe_headers(self) -> dict:
+        """Headers requesting only the start of the playlist."""
+        return {'Range': f'bytes=0-{self.PLAYLIST_PROBE_SIZE - 1}'}
+    
     def verify_stream_accessible(self, m3u8_url: str) -> Tuple[bool, Optional[str]]:
         """Verify that the stream is accessible (not private/away)."""
         try:
-            response = self._make_request(m3u8_url)
-            content = response.text.lower()
-            
-            if 'not allowed to view' in content or 'session is not allowed' in content:
-                return False, "Stream not accessible - performer may be in a private show or away"
-            if response.status_code in (400, 403):
-                return False, "Stream not accessible - performer may be in a private show or away"
-            if '#EXTM3U' in response.text:
-                return True, None
-            return False, "Invalid stream response"
+            response = self._make_request(m3u8_url, stream=True, headers=self._probe_headers())
+            try:
+                head = _read_head(response, self.PLAYLIST_PROBE_SIZE)
+            finally:
+                response.close()
+            return self._classify_playlist(response.status_code, head)
         except Exception as e:
             return False, f"Error accessing stream: {e}"
     
-    def check_performer(self, url: str) -> PerformerInfo:
-        """Check performer status and get stream URL if available."""
-        username = self.extract_username(url)
-        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
-        
-        profile = self.get_profile_info(username)
+    @staticmethod
+    def _has_playlist(stream_info: Optional[dict]) -> bool:
+        """Whether the stream info carries a playlist URL, i.e. the performer is streaming."""
+        return bool(stream_info and stream_info.get('cdnURL'))
+    
+    def _profile_result(self, username: str, profile: Optional[dict]) -> Optional[PerformerInfo]:
+        """Return a PerformerInfo if the profile rules out streaming, else None."""
         if not profile:
             return PerformerInfo(username, PerformerStatus.NOT_FOUND, 
                                 error_message=f"{username}: Performer not found")
-        
         if not profile.get('online', False):
-            return PerformerInfo(username, PerformerStatus.OFFLINE, thumbnail_url=thumbnail_url,
+            return PerformerInfo(username, PerformerStatus.OFFLINE, thumbnail_url=f"{self.THUMBNAIL_BASE_URL}/{username}",
                                 error_message=f"{username}: Performer is currently offline")
-        
-        stream_info = self.get_stream_info(username)
+        return None
+    
+    def _stream_result(self, username: str, stream_info: Optional[dict]) -> Optional[PerformerInfo]:
+        """Return a PerformerInfo if the stream info has no playlist, else None."""
         if not stream_info or not stream_info.get('cdnURL'):
-            return PerformerInfo(username, PerformerStatus.ONLINE_NOT_STREAMING, thumbnail_url=thumbnail_url,
+            return PerformerInfo(username, PerformerStatus.ONLINE_NOT_STREAMING, thumbnail_url=f"{self.THUMBNAIL_BASE_URL}/{username}",
                                 error_message=f"{username}: Performer is online but not currently streaming")
-        
-        cdn_url = stream_info['cdnURL']
-        is_accessible, error = self.verify_stream_accessible(cdn_url)
+        return None
+    
+    def _access_result(self, username: str, cdn_url: str, is_accessible: bool, error: Optional[str]) -> PerformerInfo:
+        """Build the final PerformerInfo once the playlist has been verified."""
+        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
         if not is_accessible:
             return PerformerInfo(username, PerformerStatus.PRIVATE_OR_AWAY, thumbnail_url=thumbnail_url,
                                 error_message=f"{username}: {error}")
-        
         return PerformerInfo(username, PerformerStatus.STREAMING, stream_url=cdn_url, thumbnail_url=thumbnail_url)
     
+    def check_performer(self, url: str) -> PerformerInfo:
+        """Check performer status and get stream URL if available."""
+        username = self.extract_username(url)
+        
+        # Profile and stream info are independent: the profile is fetched on a persistent
+        # worker thread while this thread fetches the stream info. A playlist URL proves the
+        # performer is streaming; the profile is only needed to explain why there is no stream
+        f_profile = _get_executor().submit(self.get_profile_info, username)
+        stream_info = self.get_stream_info(username)
+        if not self._has_playlist(stream_info):
+            return self._profile_result(username, f_profile.result()) or self._stream_result(username, stream_info)
+        
+        cdn_url = stream_info['cdnURL']
+        is_accessible, error = self.verify_stream_accessible(cdn_url)
+        return self._access_result(username, cdn_url, is_accessible, error)
+    
+    def check_streaming_only(self, url: str) -> PerformerInfo:
+        """
+        Quick "is live?" check using a single streamInfo request.
+        
+        Coarse result: STREAMING with stream_url set (playlist not verified for
+        private/away shows) or OFFLINE otherwise. Use check_performer for details.
+        """
+        username = self.extract_username(url)
+        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
+        stream_info = self.get_stream_info(username)
+        if not self._has_playlist(stream_info):
+            return PerformerInfo(username, PerformerStatus.OFFLINE, thumbnail_url=thumbnail_url,
+                                error_message=f"{username}: Performer is not currently streaming")
+        return PerformerInfo(username, PerformerStatus.STREAMING, stream_url=stream_info['cdnURL'], thumbnail_url=thumbnail_url)
+    
+    def _cookie_jar(self):
+        """Return the http.cookiejar.CookieJar backing the session (requests or curl_cffi)."""
+        return getattr(self.session.cookies, 'jar', self.session.cookies)
+    
+    async def _aget_json(self, session, url: str, empty_statuses: tuple, cookies: Optional[dict] = None) -> Optional[dict]:
+        """Fetch a JSON API endpoint with aiohttp, returning None on empty or failed responses."""
+        import asyncio
+        import aiohttp  # loaded by _new_async_session
+        try:
+            async with session.get(url, cookies=cookies) as response:
+                if response.status in empty_statuses:
+                    return None
+                response.raise_for_status()
+                return _json_loads(await response.read()) or None
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            self._log(f"Error fetching {url}: {e}")
+            return None
+    
+    async def _aget_profile_info(self, session, username: str, cookies: Optional[dict] = None) -> Optional[dict]:
+        """Async version of get_profile_info, sharing its cache."""
+        profile = self._cached_profile(username)
+        if profile is None:
+            profile = await self._aget_json(session, f"{self.BASE_API_URL}/{username}/info", (404,), cookies)
+            self._cache_profile(username, profile)
+        return profile
+    
+    async def averify_stream_accessible(self, session, m3u8_url: str) -> Tuple[bool, Optional[str]]:
+        """Async version of verify_stream_accessible."""
+        import asyncio
+        import aiohttp  # loaded by _new_async_session
+        try:
+            async with session.get(m3u8_url, headers=self._probe_headers()) as response:
+                head = await _aread_head(response, self.PLAYLIST_PROBE_SIZE)
+                return self._classify_playlist(response.status, head)
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return False, f"Error accessing stream: {e}"
+    
+    async def acheck_performer(self, url: str, session=None) -> PerformerInfo:
+        """
+        Async version of check_performer (always uses aiohttp, never FlareSolverr).
+        
+        Profile and stream info are fetched concurrently; the profile is only
+        awaited when there is no playlist to verify. Session cookies are forwarded
+        to the cam4.com API calls. Without a session, one is opened and closed for this call.
+        """
+        import asyncio
+        
+        if session is None:
+            async with _new_async_session() as session:
+                return await self.acheck_performer(url, session)
+        
+        username = self.extract_username(url)
+        cookies = {c.name: c.value for c in self._cookie_jar() if 'cam4.com' in c.domain}
+        
+        profile_task = asyncio.ensure_future(self._aget_profile_info(session, username, cookies))
+        stream_info = await self._aget_json(session, f"{self.BASE_API_URL}/{username}/streamInfo", (204, 404), cookies)
+        
+        # Same precedence as check_performer: a playlist URL means streaming
+        if not self._has_playlist(stream_info):
+            return self._profile_result(username, await profile_task) or self._stream_result(username, stream_info)
+        profile_task.cancel()
+        
+        cdn_url = stream_info['cdnURL']
+        is_accessible, error = await self.averify_stream_accessible(session, cdn_url)
+        return self._access_result(username, cdn_url, is_accessible, error)
+    
+    async def acheck_performer_batch(self, urls: list) -> list:
+        """Check several performers concurrently; results (PerformerInfo or the raised exception) follow urls order."""
+        import asyncio
+        
+        async with _new_async_session() as session:
+            return await asyncio.gather(*(self.acheck_performer(url, session) for url in urls),
+                                        return_exceptions=True)
+    
+    async def check_many(self, urls: list, concurrency: int = 16):
+        """
+        Check many performers with at most concurrency checks in flight.
+        
+        Async generator yielding (url, PerformerInfo) tuples in completion order;
+        a check that raised yields (url, exception) instead. Raises ValueError if concurrency < 1.
+        """
+        # A zero-sized semaphore would never let a check start
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        
+        import asyncio
+        semaphore = asyncio.Semaphore(concurrency)
+        
+        async def check(url):
+            async with semaphore:
+                try:
+                    return url, await self.acheck_performer(url, session)
+                except Exception as e:
+                    return url, e
+        
+        async with _new_async_session(limit_per_host=concurrency) as session:
+            tasks = [asyncio.ensure_future(check(url)) for url in urls]
+            try:
+                for future in asyncio.as_completed(tasks):
+                    yield await future
+            finally:
+                # Don't leave checks running if the caller stops iterating early,
+                # and let them finish cancelling before the session is closed
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def check_performers(self, urls: list) -> list:
+        """Synchronous wrapper around acheck_performer_batch."""
+        # asyncio is slow to import, so only the async entry points load it
+        import asyncio
+        
+        return asyncio.run(self.acheck_performer_batch(urls))
+    
     def record_stream(self, url: str, output_path: Optional[str] = None, 
-                      ffmpeg_args: Optional[list] = None) -> subprocess.Popen:
-        """Start recording a CAM4 stream using ffmpeg."""
+                      ffmpeg_args: Optional[list] = None, log_file: Optional[str] = None,
+                      log_callback: Optional[Callable[[str], None]] = None) -> subprocess.Popen:
+        """
+        Start recording a CAM4 stream using ffmpeg.
+        
+        ffmpeg's log output is discarded unless log_callback (called from a background
+        thread with chunks of output) or log_file (appended to) is given.
+        """
         info = self.check_performer(url)
         if info.status != PerformerStatus.STREAMING:
             raise CAM4Error(info.error_message, info.status)
@@ -303,12 +699,35 @@ def record_stream(self, url: str, output_path: Optional[str] = None,
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_path = f"{info.username}_{timestamp}.ts"
         
-        cmd = ['ffmpeg', '-i', info.stream_url, '-c:v', 'copy', '-c:a', 'copy', '-y']
+        cmd = list(self._FFMPEG_BASE)
+        cmd[self._FFMPEG_INPUT_INDEX] = info.stream_url
+        cmd[-1] = output_path
+        if output_path.lower().endswith('.ts'):
+            # Other extensions let ffmpeg pick the container from the file name
+            cmd[-1:-1] = ['-f', 'mpegts']
         if ffmpeg_args:
-            cmd.extend(ffmpeg_args)
-        cmd.append(output_path)
+            # Extra arguments go right before the output path
+            cmd[-1:-1] = ffmpeg_args
+        if log_callback or log_file:
+            # Errors only when the output is discarded; a requested log gets ffmpeg's normal output
+            cmd[self._FFMPEG_LOGLEVEL_INDEX] = 'info'
+        
+        # Never leave ffmpeg writing to an unread pipe: it blocks once the buffer is full
+        if log_callback:
+            stderr = subprocess.PIPE
+        elif log_file:
+            stderr = open(log_file, 'ab')
+        else:
+            stderr = subprocess.DEVNULL
+        try:
+            process = subprocess.Popen(cmd, stdout=subprocess.DEVNULL, stderr=stderr)
+        finally:
+            if stderr not in (subprocess.PIPE, subprocess.DEVNULL):
+                stderr.close()
         
-        return subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        if log_callback:
+            threading.Thread(target=_drain_pipe, args=(process.stderr, log_callback), daemon=True).start()
+        return process
     
     def download_thumbnail(self, url: str, output_path: Optional[str] = None) -> Optional[str]:
         """Download the performer's thumbnail."""
@@ -316,11 +735,19 @@ def download_thumbnail(self, url: str, output_path: Optional[str] = None) -> Opt
         if not output_path:
             output_path = f"{username}_thumb.jpg"
         
+        thumbnail_url = f"{self.THUMBNAIL_BASE_URL}/{username}"
         try:
-            response = self.session.get(f"{self.THUMBNAIL_BASE_URL}/{username}", timeout=10)
-            response.raise_for_status()
-            with open(output_path, 'wb') as f:
-                f.write(response.content)
+            if self._uses_httpx():
+                # httpx only streams bodies through Client.stream()
+                request = self.session.stream('GET', thumbnail_url, timeout=10)
+            else:
+                request = contextlib.closing(self._session_get(thumbnail_url, timeout=10, stream=True))
+            with request as response:
+                response.raise_for_status()
+                # Write in 64 KB chunks rather than holding the whole image in memory
+                with open(output_path, 'wb') as f:
+                    for chunk in _iter_body(response, 65536):
+                        f.write(chunk)
             return output_path
         except:
             return None
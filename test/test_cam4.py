@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import io
+from unittest import mock
+
+from test.helper import FakeYDL
+from yt_dlp.extractor.cam4 import CAM4IE
+from yt_dlp.networking import Response
+from yt_dlp.networking.exceptions import HTTPError
+from yt_dlp.utils import ExtractorError
+
+API_URL = 'https://www.cam4.com/rest/v1.0/profile/user'
+
+
+class TestCAM4(unittest.TestCase):
+    def _extract(self, responses):
+        """Run the extractor against canned (status, body) API responses"""
+        ydl = FakeYDL()
+        ie = CAM4IE(ydl)
+        requested = []
+
+        def urlopen(request):
+            requested.append(request.url)
+            status, body = responses[request.url]
+            response = Response(io.BytesIO(body), request.url, {}, status=status)
+            if status >= 400:
+                raise HTTPError(response)
+            return response
+
+        ydl.urlopen = urlopen
+        with mock.patch.object(ie, 'report_warning') as report_warning, \
+                mock.patch.object(ie, '_extract_m3u8_formats', return_value=[{'url': 'https://cdn/x.m3u8'}]):
+            try:
+                return ie._real_extract('https://www.cam4.com/user'), None, requested, report_warning
+            except ExtractorError as e:
+                return None, e, requested, report_warning
+
+    def test_streaming_skips_profile(self):
+        info, _, requested, report_warning = self._extract({
+            f'{API_URL}/streamInfo': (200, b'{"cdnURL": "https://cdn/x.m3u8"}'),
+        })
+        self.assertEqual(info['formats'], [{'url': 'https://cdn/x.m3u8'}])
+        self.assertEqual(requested, [f'{API_URL}/streamInfo'])
+        report_warning.assert_not_called()
+
+    def test_offline(self):
+        _, error, requested, report_warning = self._extract({
+            f'{API_URL}/streamInfo': (204, b''),
+            f'{API_URL}/info': (200, b'{"online": false}'),
+        })
+        self.assertIn('currently offline', str(error))
+        self.assertEqual(requested, [f'{API_URL}/streamInfo', f'{API_URL}/info'])
+        # An empty 204 is the normal answer for an offline performer
+        report_warning.assert_not_called()
+
+    def test_not_found(self):
+        _, error, _, _ = self._extract({
+            f'{API_URL}/streamInfo': (404, b''),
+            f'{API_URL}/info': (404, b'{}'),
+        })
+        self.assertIn('Performer not found', str(error))
+
+    def test_stream_info_error_is_reported(self):
+        _, error, _, report_warning = self._extract({
+            f'{API_URL}/streamInfo': (503, b''),
+            f'{API_URL}/info': (200, b'{"online": true}'),
+        })
+        self.assertIn('not currently streaming', str(error))
+        # Unlike a 204, a failed request must not pass silently
+        report_warning.assert_called_once()
+        self.assertIn('503', report_warning.call_args[0][0])
+
+
+if __name__ == '__main__':
+    unittest.main()
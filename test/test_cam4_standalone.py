@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+
+# Allow direct execution
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import asyncio
+import contextlib
+import importlib.util
+import io
+import json
+import re
+import subprocess
+import tempfile
+import threading
+from unittest import mock
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Both scripts refuse to import without one of their HTTP libraries
+HAS_HTTP_LIB = any(importlib.util.find_spec(name) for name in ('curl_cffi', 'requests'))
+HAS_AIOHTTP = importlib.util.find_spec('aiohttp') is not None
+HAS_REQUESTS = importlib.util.find_spec('requests') is not None
+HAS_HTTPX_H2 = all(importlib.util.find_spec(name) for name in ('httpx', 'h2'))
+
+
+def _load_module(name, path):
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def _load_modules():
+    return {
+        'root': _load_module('cam4_standalone', os.path.join(ROOT_DIR, 'cam4_standalone.py')),
+        'standalone': _load_module(
+            'standalone_cam4_standalone', os.path.join(ROOT_DIR, 'standalone', 'cam4_standalone.py')),
+    }
+
+
+@unittest.skipUnless(HAS_HTTP_LIB, 'curl_cffi or requests is required')
+class _CAM4TestCase(unittest.TestCase):
+    """Runs each test against both cam4_standalone.py and standalone/cam4_standalone.py"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.modules = _load_modules()
+
+    def _each(self):
+        for name, mod in self.modules.items():
+            with self.subTest(module=name):
+                yield mod, mod.CAM4Standalone()
+
+
+class TestProfileCache(_CAM4TestCase):
+    def test_profile_ttl(self):
+        for mod, cam4 in self._each():
+            cam4.profile_ttl = 5.0
+            fetch = mock.Mock(side_effect=[None, {'online': True}, {'online': False}])
+            now = [100.0]
+            with mock.patch.object(cam4, '_fetch_json', fetch), \
+                    mock.patch.object(mod.time, 'monotonic', lambda: now[0]):
+                # Failed lookups are not cached
+                self.assertIsNone(cam4.get_profile_info('user'))
+                self.assertEqual(cam4.get_profile_info('user'), {'online': True})
+                now[0] = 103.0
+                self.assertEqual(cam4.get_profile_info('user'), {'online': True})
+                # Expired after profile_ttl seconds
+                now[0] = 106.0
+                self.assertEqual(cam4.get_profile_info('user'), {'online': False})
+            self.assertEqual(fetch.call_count, 3)
+
+    def test_expired_entries_are_dropped(self):
+        for mod, cam4 in self._each():
+            cam4.profile_ttl = 5.0
+            now = [100.0]
+            with mock.patch.object(mod.time, 'monotonic', lambda: now[0]):
+                cam4._cache_profile('user', {'online': True})
+                now[0] = 110.0
+                self.assertIsNone(cam4._cached_profile('user'))
+            self.assertNotIn('user', cam4._profile_cache)
+
+    def test_cache_size_is_capped(self):
+        for _, cam4 in self._each():
+            cam4.PROFILE_CACHE_SIZE = 3
+            for name in ('a', 'b', 'c', 'd'):
+                cam4._cache_profile(name, {'online': True})
+            self.assertEqual(list(cam4._profile_cache), ['b', 'c', 'd'])
+            # Refreshing an entry makes it the newest
+            cam4._cache_profile('b', {'online': False})
+            cam4._cache_profile('e', {'online': True})
+            self.assertEqual(list(cam4._profile_cache), ['d', 'b', 'e'])
+
+
+@unittest.skipUnless(HAS_AIOHTTP, 'aiohttp is required')
+class TestAsyncChecks(_CAM4TestCase):
+    # Invalid URLs fail before any request is made, so these need no network
+
+    def test_check_performers_returns_exceptions(self):
+        for mod, cam4 in self._each():
+            # Sessions are per call, so a second event loop must work too
+            for _ in range(2):
+                results = cam4.check_performers(['https://example.com/a', 'not a url'])
+                self.assertEqual(len(results), 2)
+                for result in results:
+                    self.assertIsInstance(result, mod.CAM4Error)
+
+    def test_acheck_performer_without_session(self):
+        for mod, cam4 in self._each():
+            for _ in range(2):
+                with self.assertRaises(mod.CAM4Error):
+                    asyncio.run(cam4.acheck_performer('https://example.com/a'))
+
+
+class TestPlaylistClassification(_CAM4TestCase):
+    def test_classify_playlist(self):
+        playlist = b'#EXTM3U\n#EXT-X-VERSION:3\n'
+        for _, cam4 in self._each():
+            self.assertEqual(cam4._classify_playlist(200, playlist), (True, None))
+            self.assertEqual(cam4._classify_playlist(206, playlist), (True, None))
+            # Signature found past a BOM or in lowercase
+            self.assertEqual(cam4._classify_playlist(206, b'\xef\xbb\xbf#extm3u\n'), (True, None))
+            self.assertFalse(cam4._classify_playlist(403, b'')[0])
+            self.assertFalse(cam4._classify_playlist(400, playlist)[0])
+            self.assertFalse(cam4._classify_playlist(500, playlist)[0])
+            self.assertFalse(cam4._classify_playlist(200, b'<html>Not allowed to view</html>')[0])
+            self.assertEqual(
+                cam4._classify_playlist(200, b'<html></html>'), (False, 'Invalid stream response'))
+
+
+class TestPlaylistProbe(_CAM4TestCase):
+    def test_verify_stream_reads_only_the_head(self):
+        for _, cam4 in self._each():
+            response = mock.Mock(status_code=206)
+            response.iter_content.return_value = iter([b'#EXTM3U\n' + b'#' * 600])
+            cam4.session = mock.Mock()
+            cam4.session.get.return_value = response
+
+            self.assertEqual(cam4.verify_stream_accessible('https://cdn/x.m3u8'), (True, None))
+            _, kwargs = cam4.session.get.call_args
+            self.assertEqual(kwargs['headers'], {'Range': 'bytes=0-511'})
+            self.assertTrue(kwargs['stream'])
+            response.close.assert_called_once()
+
+    def test_verify_stream_request_error(self):
+        for _, cam4 in self._each():
+            cam4.session = mock.Mock()
+            cam4.session.get.side_effect = OSError('connection reset')
+            accessible, error = cam4.verify_stream_accessible('https://cdn/x.m3u8')
+            self.assertFalse(accessible)
+            self.assertIn('connection reset', error)
+
+
+class TestCheckPerformerThreads(_CAM4TestCase):
+    def test_worker_threads_persist(self):
+        for mod, cam4 in self._each():
+            profile_threads, stream_threads = set(), set()
+
+            def get_profile_info(username):
+                profile_threads.add(threading.get_ident())
+                return {'online': False}
+
+            def get_stream_info(username):
+                stream_threads.add(threading.get_ident())
+
+            with mock.patch.object(cam4, 'get_profile_info', get_profile_info), \
+                    mock.patch.object(cam4, 'get_stream_info', get_stream_info):
+                for _ in range(5):
+                    cam4.check_performer('https://www.cam4.com/user')
+
+            # Stream info is fetched on the calling thread, the profile on the shared pool,
+            # whose threads (and their connections) outlive each call
+            self.assertEqual(stream_threads, {threading.get_ident()})
+            self.assertNotIn(threading.get_ident(), profile_threads)
+            self.assertLessEqual(len(profile_threads), mod._get_executor()._max_workers)
+            self.assertIs(mod._get_executor(), mod._get_executor())
+
+
+class TestFFmpegInputOptions(_CAM4TestCase):
+    def _record(self, mod, cam4, *args, **kwargs):
+        info = mod.PerformerInfo('user', mod.PerformerStatus.STREAMING, stream_url='https://cdn/x.m3u8')
+        with mock.patch.object(cam4, 'check_performer', return_value=info), \
+                mock.patch.object(mod.subprocess, 'Popen') as popen:
+            cam4.record_stream('https://www.cam4.com/user', *args, **kwargs)
+        return popen.call_args[0][0]
+
+    def test_default_stream_selection_and_probing(self):
+        for mod, cam4 in self._each():
+            cmd = self._record(mod, cam4, 'out.ts')
+            # Only the best variant of the master playlist, with full probing for copied audio
+            for option in ('-map', '-probesize', '-analyzeduration'):
+                self.assertNotIn(option, cmd)
+            self.assertIn('+nobuffer', cmd)
+
+    def test_mpegts_only_for_ts_output(self):
+        for mod, cam4 in self._each():
+            self.assertEqual(self._record(mod, cam4, 'out.ts')[-3:], ['-f', 'mpegts', 'out.ts'])
+            self.assertEqual(self._record(mod, cam4, 'OUT.TS')[-3:], ['-f', 'mpegts', 'OUT.TS'])
+            self.assertNotIn('mpegts', self._record(mod, cam4, 'out.mp4'))
+            # The generated default name is a .ts file
+            self.assertEqual(self._record(mod, cam4)[-3:-1], ['-f', 'mpegts'])
+
+
+class TestFFmpegLog(_CAM4TestCase):
+    def test_drain_pipe(self):
+        # More than a pipe buffer, so it takes several reads
+        data = 'frame= 1 ✓ größe\n'.encode() * 10000
+        for mod, _ in self._each():
+            received = []
+
+            def callback(text):
+                if not received:
+                    received.append('')
+                    raise RuntimeError('callback failure')
+                received.append(text)
+
+            read_fd, write_fd = os.pipe()
+            thread = threading.Thread(target=mod._drain_pipe, args=(os.fdopen(read_fd, 'rb'), callback))
+            thread.start()
+            # Small writes split multi-byte characters across reads
+            for i in range(0, len(data), 7):
+                os.write(write_fd, data[i:i + 7])
+            os.close(write_fd)
+            thread.join(10)
+
+            # A failing callback doesn't stop the drain
+            self.assertFalse(thread.is_alive())
+            self.assertGreater(len(received), 1)
+            text = ''.join(received)
+            self.assertNotIn('�', text)
+            self.assertTrue(data.decode().endswith(text))
+
+    def test_loglevel(self):
+        for mod, cam4 in self._each():
+            info = mod.PerformerInfo('user', mod.PerformerStatus.STREAMING, stream_url='https://cdn/x.m3u8')
+            with tempfile.TemporaryDirectory() as tmpdir, \
+                    mock.patch.object(cam4, 'check_performer', return_value=info), \
+                    mock.patch.object(mod.subprocess, 'Popen') as popen, \
+                    mock.patch.object(mod.threading, 'Thread'):
+                cam4.record_stream('https://www.cam4.com/user', 'out.ts')
+                self.assertEqual(popen.call_args[1]['stderr'], mod.subprocess.DEVNULL)
+                levels = [popen.call_args[0][0]]
+                cam4.record_stream('https://www.cam4.com/user', 'out.ts', log_file=os.path.join(tmpdir, 'log'))
+                levels.append(popen.call_args[0][0])
+                cam4.record_stream('https://www.cam4.com/user', 'out.ts', log_callback=print)
+                self.assertEqual(popen.call_args[1]['stderr'], mod.subprocess.PIPE)
+                levels.append(popen.call_args[0][0])
+            self.assertEqual([cmd[cmd.index('-loglevel') + 1] for cmd in levels], ['error', 'info', 'info'])
+
+
+class TestCookieFile(_CAM4TestCase):
+    COOKIES_TXT = (
+        # No Netscape header, comments and a malformed line: all must be tolerated
+        '#HttpOnly_.cam4.com\tTRUE\t/\tTRUE\t0\tsession\tabc\n'
+        '# a comment\n'
+        'not a cookie line\n'
+        '\n'
+        'www.cam4.com\tFALSE\t/\tFALSE\t0\tempty\t\n'
+        '.example.com\tTRUE\t/\tFALSE\t0\tother\tx\n')
+
+    def _load(self, **kwargs):
+        mod = self.modules['standalone']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'cookies.txt')
+            with open(path, 'w') as f:
+                f.write(self.COOKIES_TXT)
+            cam4 = mod.CAM4Standalone(cookies_file=path, **kwargs)
+        return sorted((c.domain, c.name, c.value, c.secure) for c in cam4._cookie_jar())
+
+    def test_load_cookies_from_file(self):
+        self.assertEqual(self._load(), [
+            ('.cam4.com', 'session', 'abc', True),
+            ('www.cam4.com', 'empty', '', False),
+        ])
+
+    def test_missing_cookie_file(self):
+        mod = self.modules['standalone']
+        with tempfile.TemporaryDirectory() as tmpdir:
+            with self.assertRaises(OSError):
+                mod.CAM4Standalone(cookies_file=os.path.join(tmpdir, 'missing.txt'))
+
+
+class TestResultPrecedence(_CAM4TestCase):
+    def test_result_helpers(self):
+        for mod, cam4 in self._each():
+            status = mod.PerformerStatus
+            self.assertEqual(cam4._profile_result('user', None).status, status.NOT_FOUND)
+            self.assertEqual(cam4._profile_result('user', {'online': False}).status, status.OFFLINE)
+            self.assertIsNone(cam4._profile_result('user', {'online': True}))
+            self.assertEqual(cam4._stream_result('user', None).status, status.ONLINE_NOT_STREAMING)
+            self.assertEqual(cam4._stream_result('user', {'cdnURL': ''}).status, status.ONLINE_NOT_STREAMING)
+            self.assertIsNone(cam4._stream_result('user', {'cdnURL': 'https://cdn/x.m3u8'}))
+
+    def test_check_performer(self):
+        for mod, cam4 in self._each():
+            status = mod.PerformerStatus
+            cases = [
+                # A playlist URL means streaming, whatever the (possibly stale) profile says
+                ({'online': False}, {'cdnURL': 'https://cdn/x.m3u8'}, (True, None), status.STREAMING),
+                ({'online': True}, {'cdnURL': 'https://cdn/x.m3u8'}, (False, 'private'), status.PRIVATE_OR_AWAY),
+                # Without one, the profile explains why
+                (None, None, None, status.NOT_FOUND),
+                ({'online': False}, None, None, status.OFFLINE),
+                ({'online': True}, None, None, status.ONLINE_NOT_STREAMING),
+            ]
+            for profile, stream_info, access, expected in cases:
+                with mock.patch.object(cam4, 'get_profile_info', return_value=profile), \
+                        mock.patch.object(cam4, 'get_stream_info', return_value=stream_info), \
+                        mock.patch.object(cam4, 'verify_stream_accessible', return_value=access) as verify:
+                    self.assertEqual(cam4.check_performer('https://www.cam4.com/user').status, expected)
+                    self.assertEqual(verify.called, access is not None)
+
+    def test_check_streaming_only(self):
+        for mod, cam4 in self._each():
+            with mock.patch.object(cam4, 'get_profile_info') as get_profile_info, \
+                    mock.patch.object(cam4, 'get_stream_info', return_value={'cdnURL': 'https://cdn/x.m3u8'}):
+                info = cam4.check_streaming_only('https://www.cam4.com/user')
+            self.assertEqual((info.status, info.stream_url), (mod.PerformerStatus.STREAMING, 'https://cdn/x.m3u8'))
+            get_profile_info.assert_not_called()
+
+            with mock.patch.object(cam4, 'get_stream_info', return_value=None):
+                self.assertEqual(
+                    cam4.check_streaming_only('https://www.cam4.com/user').status, mod.PerformerStatus.OFFLINE)
+
+
+class TestCheckMany(_CAM4TestCase):
+    def test_concurrency_must_be_positive(self):
+        async def collect(cam4, concurrency):
+            return [result async for result in cam4.check_many(['https://www.cam4.com/user'], concurrency)]
+
+        for _, cam4 in self._each():
+            for concurrency in (0, -1):
+                with self.assertRaises(ValueError):
+                    asyncio.run(collect(cam4, concurrency))
+
+    def test_cli_rejects_bad_concurrency(self):
+        mod = self.modules['root']
+        argv = ['cam4_standalone.py', '--check', '--concurrency', '0', 'https://www.cam4.com/a']
+        with mock.patch.object(sys, 'argv', argv), contextlib.redirect_stderr(io.StringIO()) as stderr:
+            with self.assertRaises(SystemExit) as cm:
+                mod.main()
+        self.assertEqual(cm.exception.code, 2)
+        self.assertIn('--concurrency must be at least 1', stderr.getvalue())
+
+    def test_cli_json_lines_without_aiohttp(self):
+        mod = self.modules['root']
+        cam4 = mod.CAM4Standalone()
+        streaming = mod.PerformerInfo('a', mod.PerformerStatus.STREAMING, stream_url='https://cdn/a.m3u8')
+
+        def check_performer(url):
+            if url.endswith('/a'):
+                return streaming
+            return cam4.extract_username(url)
+
+        with mock.patch('importlib.util.find_spec', return_value=None), \
+                mock.patch.object(cam4, 'check_performer', check_performer), \
+                contextlib.redirect_stdout(io.StringIO()) as stdout:
+            all_streaming = mod._check_many_cli(cam4, ['https://www.cam4.com/a', 'https://example.com/b'], 4, True)
+
+        self.assertFalse(all_streaming)
+        records = [json.loads(line) for line in stdout.getvalue().splitlines()]
+        self.assertEqual([record['url'] for record in records], ['https://www.cam4.com/a', 'https://example.com/b'])
+        # Errors use the same schema as results
+        self.assertEqual(set(records[0]), set(records[1]))
+        self.assertEqual(records[0]['status'], 'streaming')
+        self.assertEqual(records[1]['status'], 'not_found')
+
+    @unittest.skipUnless(HAS_AIOHTTP, 'aiohttp is required')
+    def test_check_many_reports_exceptions(self):
+        async def collect(cam4, urls):
+            return [(url, info) async for url, info in cam4.check_many(urls, concurrency=2)]
+
+        for mod, cam4 in self._each():
+            # Invalid URLs fail before any request is made
+            results = asyncio.run(collect(cam4, ['https://example.com/a', 'https://example.com/b']))
+            self.assertEqual(sorted(url for url, _ in results), ['https://example.com/a', 'https://example.com/b'])
+            for _, info in results:
+                self.assertIsInstance(info, mod.CAM4Error)
+
+
+@unittest.skipUnless(HAS_HTTP_LIB, 'curl_cffi or requests is required')
+class TestHTTP2Transport(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.mod = _load_modules()['standalone']
+
+    def test_curl_cffi_http_version(self):
+        curl_requests = mock.Mock()
+        with mock.patch.object(self.mod, 'curl_requests', curl_requests), \
+                mock.patch.object(self.mod, 'CurlHttpVersion', mock.Mock(V2_0='2')):
+            self.mod._new_session(use_curl_cffi=True, http2=True)
+        self.assertEqual(curl_requests.Session.call_args[1]['http_version'], '2')
+
+        # Without curl_cffi.const only HTTP/2 pinning is lost, not curl_cffi itself
+        with mock.patch.object(self.mod, 'curl_requests', curl_requests), \
+                mock.patch.object(self.mod, 'CurlHttpVersion', None):
+            self.mod._new_session(use_curl_cffi=True, http2=True)
+        self.assertNotIn('http_version', curl_requests.Session.call_args[1])
+
+    @unittest.skipUnless(HAS_HTTPX_H2, 'httpx and h2 are required')
+    def test_httpx_session(self):
+        import httpx
+
+        session = self.mod._new_session(use_curl_cffi=False, http2=True)
+        self.addCleanup(session.close)
+        self.assertIsInstance(session, httpx.Client)
+
+    @unittest.skipUnless(HAS_REQUESTS, 'requests is required')
+    def test_falls_back_to_requests_without_h2(self):
+        with mock.patch.object(self.mod, 'USING_CURL_CFFI', False), \
+                mock.patch.dict(sys.modules, {'h2': None}), \
+                contextlib.redirect_stdout(io.StringIO()) as stdout:
+            cam4 = self.mod.CAM4Standalone(verbose=True, http2=True)
+        self.assertFalse(cam4._uses_httpx())
+        self.assertTrue(hasattr(cam4.session, 'mount'))
+        self.assertIn('HTTP/1.1', stdout.getvalue())
+
+    @unittest.skipUnless(HAS_HTTPX_H2, 'httpx and h2 are required')
+    def test_cookie_file_with_httpx(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'cookies.txt')
+            with open(path, 'w') as f:
+                f.write(TestCookieFile.COOKIES_TXT)
+            with mock.patch.object(self.mod, 'USING_CURL_CFFI', False):
+                cam4 = self.mod.CAM4Standalone(http2=True, cookies_file=path, cookies={'extra': '1'})
+        self.addCleanup(cam4.session.close)
+        self.assertTrue(cam4._uses_httpx())
+        self.assertEqual(sorted((c.domain, c.name, c.value, c.secure) for c in cam4._cookie_jar()), [
+            ('.cam4.com', 'extra', '1', False),
+            ('.cam4.com', 'session', 'abc', True),
+            ('www.cam4.com', 'empty', '', False),
+        ])
+
+    def test_thumbnail_streams_with_httpx(self):
+        cam4 = self.mod.CAM4Standalone()
+        response = mock.Mock(spec=['raise_for_status', 'iter_bytes'])
+        response.iter_bytes.return_value = iter([b'\xff\xd8', b'jpeg'])
+        cam4.session = mock.Mock()
+        cam4.session.stream.return_value = contextlib.nullcontext(response)
+
+        with tempfile.TemporaryDirectory() as tmpdir, \
+                mock.patch.object(cam4, '_uses_httpx', return_value=True):
+            path = cam4.download_thumbnail('https://www.cam4.com/user', os.path.join(tmpdir, 'thumb.jpg'))
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), b'\xff\xd8jpeg')
+        self.assertEqual(cam4.session.stream.call_args[0], ('GET', f'{cam4.THUMBNAIL_BASE_URL}/user'))
+        cam4.session.get.assert_not_called()
+
+
+class TestURLParsing(_CAM4TestCase):
+    def test_extract_username(self):
+        for mod, cam4 in self._each():
+            # Compiled once on the class, with the public pattern string kept for callers
+            self.assertIs(cam4._VALID_URL_RE, mod.CAM4Standalone._VALID_URL_RE)
+            self.assertEqual(mod.CAM4Standalone.VALID_URL_PATTERN, cam4._VALID_URL_RE.pattern)
+
+            self.assertEqual(cam4.extract_username('https://www.cam4.com/some_user'), 'some_user')
+            self.assertEqual(cam4.extract_username('http://de.cam4.com/user1?ref=x'), 'user1')
+            for url in ('https://example.com/user', 'cam4.com/user', 'https://www.cam4.com/'):
+                with self.assertRaises(mod.CAM4Error) as cm:
+                    cam4.extract_username(url)
+                self.assertEqual(cm.exception.status, mod.PerformerStatus.NOT_FOUND)
+
+    def test_mixed_case_urls(self):
+        for mod, cam4 in self._each():
+            # The URL is lowercased once instead of matching with re.IGNORECASE
+            self.assertFalse(cam4._VALID_URL_RE.flags & re.IGNORECASE)
+            self.assertEqual(cam4.extract_username('https://CAM4.com/SomeUser'), 'someuser')
+            self.assertEqual(cam4.extract_username('HTTPS://WWW.CAM4.COM/Some_User'), 'some_user')
+
+
+class TestFFmpegCommand(_CAM4TestCase):
+    def test_argv_template(self):
+        for mod, cam4 in self._each():
+            template = mod.CAM4Standalone._FFMPEG_BASE
+            self.assertIsInstance(template, tuple)
+            self.assertEqual(template.count(None), 2)
+            self.assertEqual(template[cam4._FFMPEG_INPUT_INDEX - 1], '-i')
+
+            info = mod.PerformerInfo('user', mod.PerformerStatus.STREAMING, stream_url='https://cdn/x.m3u8')
+            with mock.patch.object(cam4, 'check_performer', return_value=info), \
+                    mock.patch.object(mod.subprocess, 'Popen') as popen:
+                cam4.record_stream('https://www.cam4.com/user', 'out.mkv', ['-t', '60'])
+            cmd = popen.call_args[0][0]
+            self.assertEqual(cmd[0], 'ffmpeg')
+            self.assertEqual(cmd[cmd.index('-i') + 1], 'https://cdn/x.m3u8')
+            # Extra arguments go right before the output path
+            self.assertEqual(cmd[-3:], ['-t', '60', 'out.mkv'])
+            self.assertNotIn(None, cmd)
+            # Filling in the command leaves the template untouched
+            self.assertIs(mod.CAM4Standalone._FFMPEG_BASE, template)
+            self.assertEqual(template.count(None), 2)
+
+    def test_not_streaming(self):
+        for mod, cam4 in self._each():
+            info = mod.PerformerInfo('user', mod.PerformerStatus.OFFLINE, error_message='user: offline')
+            with mock.patch.object(cam4, 'check_performer', return_value=info), \
+                    mock.patch.object(mod.subprocess, 'Popen') as popen:
+                with self.assertRaises(mod.CAM4Error):
+                    cam4.record_stream('https://www.cam4.com/user')
+            popen.assert_not_called()
+
+
+class TestLazyImports(_CAM4TestCase):
+    def test_library_import_skips_async_and_cli_modules(self):
+        lazy = ('argparse', 'asyncio', 'aiohttp', 'httpx')
+        for path in ('cam4_standalone.py', os.path.join('standalone', 'cam4_standalone.py')):
+            with self.subTest(path=path):
+                # The HTTP libraries may import some of these themselves, so only what
+                # the module adds on top of them counts
+                code = '\n'.join((
+                    'import importlib.util, sys',
+                    'for name in ("curl_cffi.requests", "requests", "orjson"):',
+                    '    try:',
+                    '        __import__(name)',
+                    '    except ImportError:',
+                    '        pass',
+                    'before = set(sys.modules)',
+                    f'spec = importlib.util.spec_from_file_location("cam4", {path!r})',
+                    'spec.loader.exec_module(importlib.util.module_from_spec(spec))',
+                    f'print(sorted(name for name in set(sys.modules) - before if name in {lazy!r}))',
+                ))
+                output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT_DIR, text=True)
+                self.assertEqual(output.strip(), '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,6 +1,6 @@
 from .common import InfoExtractor
 from ..networking.exceptions import HTTPError
-from ..utils import ExtractorError
+from ..utils import ExtractorError, traverse_obj, url_or_none
 
 
 class CAM4IE(InfoExtractor):
@@ -20,30 +20,32 @@ class CAM4IE(InfoExtractor):
     def _real_extract(self, url):
         channel_id = self._match_id(url)
 
-        # First check if the performer exists and their online status
-        profile_info = self._download_json(
-            f'https://www.cam4.com/rest/v1.0/profile/{channel_id}/info',
-            channel_id, fatal=False, expected_status=404)
-
-        if not profile_info:
-            raise ExtractorError(f'{channel_id}: Performer not found', expected=True)
+        # A playlist URL in streamInfo proves the performer is streaming, so /info
+        # is only needed to explain why there is no stream
+        stream_info = None
+        res = self._download_webpage_handle(
+            f'https://www.cam4.com/rest/v1.0/profile/{channel_id}/streamInfo',
+            channel_id, 'Downloading stream info', fatal=False, expected_status=(204, 404))
+        # Offline performers get an empty 204, which is not worth a JSON parse warning
+        if res and res[0].strip():
+            stream_info = self._parse_json(res[0], channel_id, fatal=False)
 
-        is_online = profile_info.get('online', False)
+        m3u8_playlist = traverse_obj(stream_info, ('cdnURL', {url_or_none}))
+        if not m3u8_playlist:
+            profile_info = self._download_json(
+                f'https://www.cam4.com/rest/v1.0/profile/{channel_id}/info',
+                channel_id, fatal=False, expected_status=404)
 
-        if not is_online:
-            raise ExtractorError(f'{channel_id}: Performer is currently offline', expected=True)
+            if not profile_info:
+                raise ExtractorError(f'{channel_id}: Performer not found', expected=True)
 
-        # Performer is online, try to get stream info
-        stream_info = self._download_json(
-            f'https://www.cam4.com/rest/v1.0/profile/{channel_id}/streamInfo',
-            channel_id, fatal=False, expected_status=(204, 404))
+            if not profile_info.get('online', False):
+                raise ExtractorError(f'{channel_id}: Performer is currently offline', expected=True)
 
-        if not stream_info:
-            raise ExtractorError(
-                f'{channel_id}: Performer is online but not currently streaming', expected=True)
+            if not stream_info:
+                raise ExtractorError(
+                    f'{channel_id}: Performer is online but not currently streaming', expected=True)
 
-        m3u8_playlist = stream_info.get('cdnURL')
-        if not m3u8_playlist:
             raise ExtractorError(
                 f'{channel_id}: Stream info found but no playlist URL available', expected=True)
 